@@ -37,8 +37,9 @@ directory
 
 """
 import pytest
+from fparser.two import Fortran2003, parser, symbol_table, utils
 from fparser.two.parser import ParserFactory
-from fparser.two.symbol_table import SYMBOL_TABLES
+from fparser.two.symbol_table import SymbolTables, SYMBOL_TABLES
 
 
 @pytest.fixture
@@ -47,10 +48,13 @@ def f2003_create():
     _ = ParserFactory().create(std="f2003")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def f2003_parser():
     """Create a Fortran 2003 parser class hierarchy and return the parser
-    for usage in tests.
+    for usage in tests. Creating the parser is expensive and so this is
+    only done once per test module. (It is not safe to share it across
+    the whole session since tests elsewhere set up the Fortran2008 class
+    hierarchy.)
 
     :return: a Program class (not object) for use with the Fortran reader.
     :rtype: :py:class:`fparser.two.Fortran2003.Program`
@@ -60,10 +64,33 @@ def f2003_parser():
 
 @pytest.fixture(name="clear_symbol_table", autouse=True)
 def clear_symbol_tables_fixture():
-    """Clear-up any existing symbol-table hierarchy."""
+    """Clear-up any existing symbol-table hierarchy both before and after
+    each test so that no state leaks between tests, whichever pytest-xdist
+    worker they are run on."""
+    SYMBOL_TABLES.clear()
+    yield
     SYMBOL_TABLES.clear()
 
 
+@pytest.fixture(name="symbol_tables")
+def symbol_tables_fixture(monkeypatch):
+    """Replaces the global SYMBOL_TABLES with a new, empty SymbolTables
+    instance for the duration of a test. The new instance retains the
+    classes that define scoping units so that it may be populated by the
+    parser.
+
+    :returns: the SymbolTables instance in use for this test.
+    :rtype: :py:class:`fparser.two.symbol_table.SymbolTables`
+
+    """
+    tables = SymbolTables()
+    tables.scoping_unit_classes = SYMBOL_TABLES.scoping_unit_classes
+    # SYMBOL_TABLES is imported by name into each of these modules.
+    for module in [symbol_table, parser, utils, Fortran2003]:
+        monkeypatch.setattr(module, "SYMBOL_TABLES", tables)
+    return tables
+
+
 @pytest.fixture(name="fake_symbol_table")
 def setup_symbol_table_fixture():
     """Creates a current scope for those tests that would otherwise
@@ -37,9 +37,65 @@
  of fparser2. """
 
 import pytest
-from fparser.two.symbol_table import SymbolTable, SYMBOL_TABLES, SymbolTableError
+from fparser.two.symbol_table import SymbolTable, SymbolTableError
 from fparser.api import get_reader
 
+# Fortran source used by the parser-based tests.
+_SRC_MODULE_USE = """\
+PROGRAM a_prog
+  use some_mod
+END PROGRAM a_prog
+"""
+_SRC_MODULE_USE_WITH_ONLY = """\
+PROGRAM a_prog
+  use some_mod, only:
+  use mod2, only: this_one, that_one
+END PROGRAM a_prog
+"""
+_SRC_MODULE_DEFINITION = """\
+module my_mod
+  use some_mod
+  real :: a
+end module my_mod
+"""
+_SRC_ROUTINE_IN_MODULE = """\
+module my_mod
+  use some_mod
+  real :: a
+contains
+  subroutine my_sub()
+  end subroutine my_sub
+end module my_mod
+"""
+_SRC_ROUTINE_IN_PROG = """\
+program my_prog
+  use some_mod
+  real :: a
+contains
+  subroutine my_sub()
+    real :: b
+  end subroutine my_sub
+end program my_prog
+"""
+
+
+@pytest.fixture(name="basic_table")
+def basic_table_fixture():
+    """:returns: a new symbol table named 'basic' with consistency \
+                 checking disabled.
+    :rtype: :py:class:`fparser.two.symbol_table.SymbolTable`
+    """
+    return SymbolTable("basic")
+
+
+@pytest.fixture(name="checked_table")
+def checked_table_fixture():
+    """:returns: a new symbol table named 'basic' with consistency \
+                 checking enabled.
+    :rtype: :py:class:`fparser.two.symbol_table.SymbolTable`
+    """
+    return SymbolTable("basic", checking_enabled=True)
+
 
 def test_basic_table():
     """Check the basic functionality of a symbol table."""
@@ -50,9 +106,8 @@ def test_basic_table():
     assert table.children == []
     # Consistency checking is disabled by default
     assert table._checking_enabled is False
-    with pytest.raises(KeyError) as err:
+    with pytest.raises(KeyError, match=r"Failed to find symbol named 'missing'"):
         table.lookup("missing")
-    assert "Failed to find symbol named 'missing'" in str(err.value)
     # Add a symbol and check that its naming is not case sensitive
     table.add_data_symbol("Var", "integer")
     sym = table.lookup("var")
@@ -63,46 +118,49 @@ def test_basic_table():
     assert table2._checking_enabled is True
 
 
-def test_add_data_symbol():
+def test_add_data_symbol(checked_table):
     """Test that the add_data_symbol() method behaves as expected when
     validation is enabled."""
-    table = SymbolTable("basic", checking_enabled=True)
+    table = checked_table
     table.add_data_symbol("var", "integer")
     sym = table.lookup("var")
     assert sym.primitive_type == "integer"
-    with pytest.raises(SymbolTableError) as err:
+    with pytest.raises(
+        SymbolTableError,
+        match=r"Symbol table already contains a symbol for a variable with name "
+        r"'var'",
+    ):
         table.add_data_symbol("var", "real")
-    assert (
-        "Symbol table already contains a symbol for a variable with name "
-        "'var'" in str(err.value)
-    )
-    with pytest.raises(TypeError) as err:
+    with pytest.raises(
+        TypeError, match=r"name of the symbol must be a str but got 'SymbolTable'"
+    ):
         table.add_data_symbol(table, "real")
-    assert "name of the symbol must be a str but got 'SymbolTable'" in str(err.value)
-    with pytest.raises(TypeError) as err:
+    with pytest.raises(
+        TypeError,
+        match=r"primitive type of the symbol must be specified as a str but got "
+        r"'SymbolTable'",
+    ):
         table.add_data_symbol("var2", table)
-    assert (
-        "primitive type of the symbol must be specified as a str but got "
-        "'SymbolTable'" in str(err.value)
-    )
     # Check a clash with a USE statement - both the module name and the
     # name of imported variables
     table.add_use_symbols("mod1", ["var3"])
-    with pytest.raises(SymbolTableError) as err:
+    with pytest.raises(
+        SymbolTableError,
+        match=r"table already contains a use of a module with name 'mod1'",
+    ):
         table.add_data_symbol("mod1", "real")
-    assert "table already contains a use of a module with name 'mod1'" in str(err.value)
-    with pytest.raises(SymbolTableError) as err:
+    with pytest.raises(
+        SymbolTableError,
+        match=r"table already contains a use of a symbol named 'var3' from "
+        r"module 'mod1'",
+    ):
         table.add_data_symbol("var3", "real")
-    assert (
-        "table already contains a use of a symbol named 'var3' from "
-        "module 'mod1'" in str(err.value)
-    )
 
 
-def test_add_data_symbols_no_checks():
+def test_add_data_symbols_no_checks(basic_table):
     """Check that we can disable the checks in the
     add_data_symbol() method."""
-    table = SymbolTable("basic", checking_enabled=False)
+    table = basic_table
     table.add_data_symbol("var", "integer")
     table.add_data_symbol("var", "real")
     sym = table.lookup("var")
@@ -114,9 +172,9 @@ def test_add_data_symbols_no_checks():
     assert table.lookup("var3").primitive_type == "real"
 
 
-def test_add_use_symbols():
+def test_add_use_symbols(basic_table):
     """Test that the add_use_symbols() method behaves as expected."""
-    table = SymbolTable("basic")
+    table = basic_table
     # A use without an 'only' clause
     table.add_use_symbols("mod1")
     assert table._modules["mod1"] is None
@@ -132,31 +190,35 @@ def test_add_use_symbols():
     assert table._modules["mod2"] == ["ivar", "jvar"]
 
 
-def test_add_use_symbols_errors():
+def test_add_use_symbols_errors(basic_table):
     """Test the various checks on the supplied parameters to
     add_use_symbols()."""
-    table = SymbolTable("basic")
-    with pytest.raises(TypeError) as err:
+    table = basic_table
+    with pytest.raises(
+        TypeError, match=r"name of the module must be a str but got 'SymbolTable'"
+    ):
         table.add_use_symbols(table)
-    assert "name of the module must be a str but got 'SymbolTable'" in str(err.value)
-    with pytest.raises(TypeError) as err:
+    with pytest.raises(
+        TypeError, match=r"If present, the only_list must be a list but got 'str'"
+    ):
         table.add_use_symbols("mod3", only_list="hello")
-    assert "If present, the only_list must be a list but got 'str'" in str(err.value)
-    with pytest.raises(TypeError) as err:
+    with pytest.raises(
+        TypeError,
+        match=r"If present, the only_list must be a list of str but got: "
+        r"\['str', 'SymbolTable'\]",
+    ):
         table.add_use_symbols("mod3", only_list=["hello", table])
-    assert (
-        "If present, the only_list must be a list of str but got: ['str', "
-        "'SymbolTable']" in str(err.value)
-    )
 
 
-def test_str_method():
+def test_str_method(basic_table):
     """Test the str property of the SymbolTable class."""
-    table = SymbolTable("basic")
+    table = basic_table
     assert "Symbol Table 'basic'\nSymbols:\nUsed modules:\n" in str(table)
     table.add_data_symbol("var", "integer")
-    assert "Symbol Table 'basic'\nSymbols:\nvar\nUsed modules:\n" in str(table)
+    assert "var" in table._data_symbols
     table.add_use_symbols("some_mod")
+    assert "some_mod" in table._modules
+    # A single check that populated symbols and modules are rendered.
     assert "Symbol Table 'basic'\nSymbols:\nvar\nUsed modules:\nsome_mod\n" in str(
         table
     )
@@ -167,11 +229,11 @@ def test_del_child():
     table = SymbolTable("BASIC")
     inner_table = SymbolTable("func1", parent=table)
     table.add_child(inner_table)
-    with pytest.raises(KeyError) as err:
+    with pytest.raises(
+        KeyError,
+        match=r"Symbol table 'basic' does not contain a table named 'missing'",
+    ):
         table.del_child("missing")
-    assert "Symbol table 'basic' does not contain a table named 'missing'" in str(
-        err.value
-    )
     table.del_child("func1")
     assert table.children == []
 
@@ -179,19 +241,20 @@ def test_del_child():
 def test_parent_child():
     """Test the parent/child-related properties."""
     table = SymbolTable("BASIC")
-    with pytest.raises(TypeError) as err:
+    with pytest.raises(
+        TypeError, match=r"Expected a SymbolTable instance but got 'str'"
+    ):
         table.add_child("wrong")
-    assert "Expected a SymbolTable instance but got 'str'" in str(err.value)
     inner_table = SymbolTable("func1", parent=table)
     table.add_child(inner_table)
     assert table.children == [inner_table]
     assert inner_table.parent is table
-    with pytest.raises(TypeError) as err:
+    with pytest.raises(
+        TypeError,
+        match=r"Unless it is None, the parent of a SymbolTable must also be a "
+        r"SymbolTable but got 'str'",
+    ):
         inner_table.parent = "wrong"
-    assert (
-        "Unless it is None, the parent of a SymbolTable must also be a "
-        "SymbolTable but got 'str'" in str(err.value)
-    )
 
 
 def test_root_property():
@@ -205,62 +268,30 @@ def test_root_property():
     assert table.root is table
 
 
-def test_module_use(f2003_parser):
+def _check_module_use(tables):
     """Check that a USE of a module is captured in the symbol table."""
-    _ = f2003_parser(
-        get_reader(
-            """\
-PROGRAM a_prog
-  use some_mod
-END PROGRAM a_prog
-    """
-        )
-    )
-    tables = SYMBOL_TABLES
     table = tables.lookup("a_prog")
     assert isinstance(table, SymbolTable)
     assert table.parent is None
     assert "some_mod" in table._modules
 
 
-def test_module_use_with_only(f2003_parser):
+def _check_module_use_with_only(tables):
     """Check that USE statements with an ONLY: clause are correctly captured
     in the symbol table."""
-    _ = f2003_parser(
-        get_reader(
-            """\
-PROGRAM a_prog
-  use some_mod, only:
-  use mod2, only: this_one, that_one
-END PROGRAM a_prog
-    """
-        )
-    )
-    tables = SYMBOL_TABLES
     table = tables.lookup("a_prog")
     assert isinstance(table, SymbolTable)
     assert table.parent is None
     assert "some_mod" in table._modules
     assert table._modules["some_mod"] is None
     assert "mod2" in table._modules
-    assert sorted(table._modules["mod2"]) == ["that_one", "this_one"]
+    assert set(table._modules["mod2"]) == {"that_one", "this_one"}
 
 
-def test_module_definition(f2003_parser):
+def _check_module_definition(tables):
     """Check that a SymbolTable is created for a module and populated with
     the symbols it defines."""
-    _ = f2003_parser(
-        get_reader(
-            """\
-module my_mod
-  use some_mod
-  real :: a
-end module my_mod
-    """
-        )
-    )
-    tables = SYMBOL_TABLES
-    assert list(tables._symbol_tables.keys()) == ["my_mod"]
+    assert set(tables._symbol_tables) == {"my_mod"}
     table = tables.lookup("my_mod")
     assert isinstance(table, SymbolTable)
     assert "some_mod" in table._modules
@@ -270,24 +301,10 @@ end module my_mod
     assert sym.primitive_type == "real"
 
 
-def test_routine_in_module(f2003_parser):
+def _check_routine_in_module(tables):
     """Check that we get two, nested symbol tables when a module contains
     a subroutine."""
-    _ = f2003_parser(
-        get_reader(
-            """\
-module my_mod
-  use some_mod
-  real :: a
-contains
-  subroutine my_sub()
-  end subroutine my_sub
-end module my_mod
-    """
-        )
-    )
-    tables = SYMBOL_TABLES
-    assert list(tables._symbol_tables.keys()) == ["my_mod"]
+    assert set(tables._symbol_tables) == {"my_mod"}
     table = tables.lookup("my_mod")
     assert len(table.children) == 1
     assert table.children[0].name == "my_sub"
@@ -298,27 +315,37 @@ end module my_mod
     assert sym.primitive_type == "real"
 
 
-def test_routine_in_prog(f2003_parser):
+def _check_routine_in_prog(tables):
     """Check that we get two, nested symbol tables when a program contains
     a subroutine."""
-    _ = f2003_parser(
-        get_reader(
-            """\
-program my_prog
-  use some_mod
-  real :: a
-contains
-  subroutine my_sub()
-    real :: b
-  end subroutine my_sub
-end program my_prog
-    """
-        )
-    )
-    tables = SYMBOL_TABLES
-    assert list(tables._symbol_tables.keys()) == ["my_prog"]
-    table = SYMBOL_TABLES.lookup("my_prog")
+    assert set(tables._symbol_tables) == {"my_prog"}
+    table = tables.lookup("my_prog")
     assert len(table.children) == 1
     assert table.children[0].name == "my_sub"
     assert table.children[0]._data_symbols["b"].name == "b"
     assert table.children[0].parent is table
+
+
+@pytest.mark.parametrize(
+    "code,check",
+    [
+        (_SRC_MODULE_USE, _check_module_use),
+        (_SRC_MODULE_USE_WITH_ONLY, _check_module_use_with_only),
+        (_SRC_MODULE_DEFINITION, _check_module_definition),
+        (_SRC_ROUTINE_IN_MODULE, _check_routine_in_module),
+        (_SRC_ROUTINE_IN_PROG, _check_routine_in_prog),
+    ],
+    ids=[
+        "module_use",
+        "module_use_with_only",
+        "module_definition",
+        "routine_in_module",
+        "routine_in_prog",
+    ],
+)
+def test_parse_symbol_tables(f2003_parser, symbol_tables, code, check):
+    """Check that parsing the supplied code creates the expected symbol
+    tables. Each check function receives the SymbolTables instance that
+    was populated by the parser."""
+    _ = f2003_parser(get_reader(code))
+    check(symbol_tables)